@@ -1,7 +1,11 @@
 """Gene report reader package."""
 
+from typing import TYPE_CHECKING, Any
+
 from .parser import parse_report_text, format_markdown_table
-from .ocr_client import OCRClient, OCRClientError
+
+if TYPE_CHECKING:  # pragma: no cover - imported lazily below
+    from .ocr_client import OCRClient, OCRClientError
 
 __all__ = [
     "parse_report_text",
@@ -9,3 +13,17 @@ __all__ = [
     "OCRClient",
     "OCRClientError",
 ]
+
+_LAZY_ATTRIBUTES = {"OCRClient", "OCRClientError"}
+
+
+def __getattr__(name: str) -> Any:
+    # The OCR client is only needed for OCR, so parser-only users do not pay
+    # for importing it until it is first accessed.
+    if name in _LAZY_ATTRIBUTES:
+        from . import ocr_client
+
+        value = getattr(ocr_client, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -2,14 +2,20 @@
 
 from __future__ import annotations
 
+import concurrent.futures
 import pathlib
 import tkinter as tk
 from tkinter import filedialog, messagebox, ttk
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from .ocr_client import OCRClient, OCRClientError
 from .parser import ParsedReport, format_markdown_table, parse_report_text
 
+# Tables with more rows than this are filled in chunks between idle callbacks
+# so the event loop can keep the window responsive.
+_TABLE_CHUNK_THRESHOLD = 500
+_TABLE_CHUNK_SIZE = 100
+
 
 class Application(tk.Tk):
     """Main application window."""
@@ -21,10 +27,21 @@ class Application(tk.Tk):
 
         self._ocr_client: Optional[OCRClient] = None
         self._report: Optional[ParsedReport] = None
-        self._image_path: Optional[pathlib.Path] = None
+        self._image_paths: Tuple[pathlib.Path, ...] = ()
+        # OCR runs on a worker thread so the window stays responsive; results
+        # are handed back to the Tk main loop via ``after``.
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=2)
+        # Bumped whenever the table is refilled so stale chunks are dropped.
+        self._table_generation = 0
+        # Value currently shown for each table row, keyed by its iid.
+        self._table_values: Dict[str, str] = {}
 
         self._build_widgets()
 
+    def destroy(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        super().destroy()
+
     # ------------------------------------------------------------------ Widgets
     def _build_widgets(self) -> None:
         main_frame = ttk.Frame(self, padding=12)
@@ -34,13 +51,13 @@ class Application(tk.Tk):
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(fill=tk.X)
 
-        load_button = ttk.Button(button_frame, text="Load Image", command=self._on_load)
+        load_button = ttk.Button(button_frame, text="Load Images", command=self._on_load)
         load_button.pack(side=tk.LEFT)
 
-        process_button = ttk.Button(
+        self.process_button = ttk.Button(
             button_frame, text="Run OCR", command=self._on_process, state=tk.NORMAL
         )
-        process_button.pack(side=tk.LEFT, padx=(8, 0))
+        self.process_button.pack(side=tk.LEFT, padx=(8, 0))
 
         export_button = ttk.Button(
             button_frame, text="Export Markdown", command=self._on_export
@@ -78,29 +95,68 @@ class Application(tk.Tk):
             ("Images", "*.png *.jpg *.jpeg *.tif *.tiff *.bmp"),
             ("All files", "*.*"),
         ]
-        path = filedialog.askopenfilename(title="Select report image", filetypes=filetypes)
-        if not path:
+        paths = filedialog.askopenfilenames(
+            title="Select report images", filetypes=filetypes
+        )
+        if not paths:
             return
 
-        self._image_path = pathlib.Path(path)
-        self.status_label.configure(text=f"Loaded {self._image_path.name}")
+        # Several images (e.g. the pages of one report) are OCR'd as one batch.
+        self._image_paths = tuple(pathlib.Path(path) for path in paths)
+        self.status_label.configure(text=f"Loaded {self._describe_images()}")
         self.raw_text.delete("1.0", tk.END)
-        self.tree.delete(*self.tree.get_children())
+        self._populate_table(())
         self._report = None
 
+    def _describe_images(self) -> str:
+        if len(self._image_paths) == 1:
+            return self._image_paths[0].name
+        return f"{len(self._image_paths)} images"
+
     def _ensure_ocr_client(self) -> OCRClient:
         if self._ocr_client is None:
             self._ocr_client = OCRClient()
         return self._ocr_client
 
     def _on_process(self) -> None:
-        if not self._image_path:
+        if not self._image_paths:
             messagebox.showinfo("No image", "Please load an image first.")
             return
 
+        image_paths = self._image_paths
+        self.process_button.configure(state=tk.DISABLED)
+        self.status_label.configure(text=f"Running OCR on {self._describe_images()}...")
+
+        future = self._executor.submit(self._run_ocr, image_paths)
+        future.add_done_callback(
+            lambda fut: self._call_in_main_loop(self._on_ocr_done, image_paths, fut)
+        )
+
+    def _run_ocr(self, image_paths: Tuple[pathlib.Path, ...]) -> str:
+        """Worker-thread half of :meth:`_on_process`."""
+
+        client = self._ensure_ocr_client()
+        texts = client.extract_text_batch([str(path) for path in image_paths])
+        return "\n\n".join(texts)
+
+    def _call_in_main_loop(self, callback, *args) -> None:
         try:
-            client = self._ensure_ocr_client()
-            text = client.extract_text(str(self._image_path))
+            self.after(0, callback, *args)
+        except (RuntimeError, tk.TclError):  # pragma: no cover - window closed
+            pass
+
+    def _on_ocr_done(
+        self,
+        image_paths: Tuple[pathlib.Path, ...],
+        future: "concurrent.futures.Future[str]",
+    ) -> None:
+        self.process_button.configure(state=tk.NORMAL)
+        if image_paths != self._image_paths:
+            # Different images were loaded while OCR was running.
+            return
+
+        try:
+            text = future.result()
         except OCRClientError as exc:
             messagebox.showerror("OCR unavailable", str(exc))
             self.status_label.configure(text="OCR failed")
@@ -118,16 +174,58 @@ class Application(tk.Tk):
         self.status_label.configure(text="OCR complete")
 
     def _populate_table(self, pairs) -> None:
-        self.tree.delete(*self.tree.get_children())
-        for field, value in pairs:
-            self.tree.insert("", tk.END, values=(field, value))
+        # Rows use the field name as their iid, so refilling the table only
+        # deletes, updates or inserts the rows that actually changed.
+        self._table_generation += 1
+        rows = list(pairs)
+        fields = {field for field, _ in rows}
+        shown = self.tree.get_children()
+        stale = [iid for iid in shown if iid not in fields]
+        if stale:
+            self.tree.delete(*stale)
+            for iid in stale:
+                self._table_values.pop(iid, None)
+
+        kept = [field for field, _ in rows if field in self._table_values]
+        reorder = kept != [iid for iid in shown if iid in fields]
+        if len(rows) <= _TABLE_CHUNK_THRESHOLD:
+            self._apply_rows(rows, 0, len(rows), reorder)
+        else:
+            self._apply_row_chunks(rows, 0, reorder, self._table_generation)
+
+    def _apply_rows(self, rows, start: int, end: int, reorder: bool) -> None:
+        # Hide the columns while updating so the tree is redrawn once rather
+        # than after every row.
+        self.tree.configure(displaycolumns=())
+        try:
+            for index in range(start, end):
+                field, value = rows[index]
+                if field not in self._table_values:
+                    self.tree.insert("", index, iid=field, values=(field, value))
+                else:
+                    if self._table_values[field] != value:
+                        self.tree.item(field, values=(field, value))
+                    if reorder:
+                        self.tree.move(field, "", index)
+                self._table_values[field] = value
+        finally:
+            self.tree.configure(displaycolumns="#all")
+
+    def _apply_row_chunks(
+        self, rows, start: int, reorder: bool, generation: int
+    ) -> None:
+        if generation != self._table_generation:
+            return
+        end = min(start + _TABLE_CHUNK_SIZE, len(rows))
+        self._apply_rows(rows, start, end, reorder)
+        if end < len(rows):
+            self.after_idle(self._apply_row_chunks, rows, end, reorder, generation)
 
     def _on_export(self) -> None:
         if not self._report:
             messagebox.showinfo("Nothing to export", "Run OCR before exporting.")
             return
 
-        markdown = self._report.to_markdown()
         path = filedialog.asksaveasfilename(
             title="Save Markdown",
             defaultextension=".md",
@@ -136,7 +234,9 @@ class Application(tk.Tk):
         if not path:
             return
 
-        pathlib.Path(path).write_text(markdown, encoding="utf-8")
+        # Stream the table to disk instead of building the whole document first.
+        with open(path, "w", encoding="utf-8", buffering=1 << 20) as stream:
+            self._report.write_markdown(stream)
         messagebox.showinfo("Export complete", f"Saved table to {path}")
 
 
@@ -2,15 +2,76 @@
 
 from __future__ import annotations
 
+import hashlib
 import importlib
-from dataclasses import dataclass
-from typing import Callable, Optional
+import os
+import pathlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Callable, ClassVar, List, Optional, Sequence, Tuple, TypeVar
 
 
 class OCRClientError(RuntimeError):
     """Exception raised when the OCR backend cannot be used."""
 
 
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+# Substrings identifying rate-limit style failures from hosted backends.
+_TRANSIENT_ERROR_MARKERS = ("rate limit", "429", "quota")
+# Subclasses of the retried OSError/RuntimeError branches that will fail the
+# same way on every attempt.
+_PERMANENT_ERRORS = (
+    OCRClientError,
+    NotImplementedError,
+    RecursionError,
+    FileNotFoundError,
+    IsADirectoryError,
+    NotADirectoryError,
+    PermissionError,
+)
+
+
+def _is_transient_error(exc: BaseException) -> bool:
+    """Return ``True`` if the backend call that raised ``exc`` may be retried."""
+
+    if isinstance(exc, _PERMANENT_ERRORS):
+        return False
+    if isinstance(exc, (OSError, RuntimeError)):
+        return True
+    message = str(exc).lower()
+    return any(marker in message for marker in _TRANSIENT_ERROR_MARKERS)
+
+
+def _default_cache_dir() -> pathlib.Path:
+    """Return the directory used to persist OCR results between runs."""
+
+    base = os.environ.get("XDG_CACHE_HOME") or pathlib.Path.home() / ".cache"
+    return pathlib.Path(base) / "gene-report-reader" / "ocr"
+
+
+def _image_digest(image_path: str) -> bytes:
+    data = pathlib.Path(image_path).read_bytes()
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+_BATCH_ENTRY_POINTS = ("ocr_batch", "extract_text_batch", "recognize_batch")
+
+_BatchCallable = Callable[[Sequence[str]], List[str]]
+_Backend = Tuple[Callable[[str], str], Optional[_BatchCallable]]
+
+
+def _find_batch_callable(obj: object) -> Optional[_BatchCallable]:
+    for name in _BATCH_ENTRY_POINTS:
+        attr = getattr(obj, name, None)
+        if callable(attr):
+            return attr  # type: ignore[return-value]
+    return None
+
+
 @dataclass
 class OCRClient:
     """Thin wrapper around the ``olmOCR2`` library.
@@ -20,20 +81,72 @@ class OCRClient:
     points.  If the package is not available or does not expose a supported
     function, a helpful :class:`OCRClientError` is raised so the GUI can present
     a friendly error message to the user.
+
+    Recognised text is cached by a hash of the image contents, both in memory
+    (up to ``cache_size`` entries) and as ``<hash>.txt`` files in
+    ``cache_dir`` (up to ``disk_cache_size`` files, least recently used evicted
+    first) so that re-processing the same report skips the backend.  The files
+    hold patient data, so the directory and files are created readable by the
+    current user only.  Set ``cache_dir`` to ``None`` to keep the cache in
+    memory only.
+
+    When the backend also exposes a batch entry point (``ocr_batch``,
+    ``extract_text_batch`` or ``recognize_batch``) it is used by
+    :meth:`extract_text_batch` to recognise several images in a single call.
+
+    Transient backend failures (``OSError``/``RuntimeError`` such as CUDA
+    out-of-memory, or rate-limit and quota errors) are retried up to
+    ``max_attempts`` times with exponential backoff starting at
+    ``retry_base_delay`` seconds and capped at ``retry_max_delay``.
     """
 
     _callable: Optional[Callable[[str], str]] = None
+    _batch_callable: Optional[_BatchCallable] = None
+    cache_size: int = 64
+    cache_dir: Optional[pathlib.Path] = field(default_factory=_default_cache_dir)
+    disk_cache_size: int = 512
+    max_attempts: int = 3
+    retry_base_delay: float = 0.5
+    retry_max_delay: float = 8.0
+    _cache: "OrderedDict[bytes, str]" = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _cache_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
+
+    # Backend discovery imports ``olmOCR2`` and may instantiate a model, so the
+    # result is resolved once and shared by every client.
+    _resolved_backend: ClassVar[Optional[_Backend]] = None
+    _resolve_lock: ClassVar[threading.Lock] = threading.Lock()
 
     def __post_init__(self) -> None:
         if self._callable is None:
-            self._callable = self._discover_backend()
+            self._load_backend()
 
-    def _discover_backend(self) -> Callable[[str], str]:
-        """Return a callable that performs OCR using ``olmOCR2``.
+    def _load_backend(self) -> None:
+        self._callable, batch_callable = type(self)._resolve_backend()
+        if self._batch_callable is None:
+            self._batch_callable = batch_callable
+
+    @classmethod
+    def _resolve_backend(cls) -> _Backend:
+        resolved = cls._resolved_backend
+        if resolved is None:
+            with cls._resolve_lock:
+                if cls._resolved_backend is None:
+                    cls._resolved_backend = cls._discover_backend()
+                resolved = cls._resolved_backend
+        return resolved
+
+    @classmethod
+    def _discover_backend(cls) -> _Backend:
+        """Return the callables that perform OCR using ``olmOCR2``.
 
         The actual API surface of ``olmOCR2`` varies between versions, so we try
-        a few common attribute names.  The callable must accept a path to an
-        image on disk and return the recognised text as a string.
+        a few common attribute names.  The first callable must accept a path to
+        an image on disk and return the recognised text as a string; the second
+        is a matching batch entry point, or ``None`` if there is none.
         """
 
         try:
@@ -55,7 +168,7 @@ class OCRClient:
         for name in candidate_names:
             attr = getattr(module, name, None)
             if callable(attr):
-                return attr  # type: ignore[return-value]
+                return attr, _find_batch_callable(module)
 
         # Some versions expose a class-based API.  Try to instantiate common
         # class names that provide an ``ocr``/``recognize`` method.
@@ -67,14 +180,14 @@ class OCRClient:
         )
 
         for cls_name in class_candidates:
-            cls = getattr(module, cls_name, None)
-            if cls is None:
+            backend_cls = getattr(module, cls_name, None)
+            if backend_cls is None:
                 continue
-            instance = cls()
+            instance = backend_cls()
             for method_name in ("ocr", "ocr_image", "extract_text", "recognize"):
                 method = getattr(instance, method_name, None)
                 if callable(method):
-                    return method  # type: ignore[return-value]
+                    return method, _find_batch_callable(instance)
 
         raise OCRClientError(
             "Could not find a supported OCR entry point in 'olmOCR2'. "
@@ -90,10 +203,120 @@ class OCRClient:
             Path to an image that should be passed to the OCR backend.
         """
 
+        digest = _image_digest(image_path)
+        cached = self._cache_get(digest)
+        if cached is not None:
+            return cached
+
+        if self._callable is None:  # pragma: no cover - defensive
+            self._load_backend()
+
+        text = self._invoke_with_retry(self._callable, image_path)
+        self._cache_put(digest, text)
+        return text
+
+    def extract_text_batch(self, image_paths: Sequence[str]) -> List[str]:
+        """Return the text recognised from each of ``image_paths``, in order.
+
+        Cached images are served from the cache; the remaining ones are sent
+        to the backend's batch entry point in a single call when available,
+        otherwise one at a time.
+        """
+
+        digests = [_image_digest(path) for path in image_paths]
+        results = [self._cache_get(digest) for digest in digests]
+        missing = [index for index, text in enumerate(results) if text is None]
+        if not missing:
+            return results  # type: ignore[return-value]
+
         if self._callable is None:  # pragma: no cover - defensive
-            self._callable = self._discover_backend()
+            self._load_backend()
+
+        pending = [image_paths[index] for index in missing]
+        if self._batch_callable is not None:
+            texts = list(self._invoke_with_retry(self._batch_callable, pending))
+            if len(texts) != len(pending):
+                raise OCRClientError(
+                    f"The OCR backend returned {len(texts)} results for "
+                    f"{len(pending)} images."
+                )
+        else:
+            texts = [self._invoke_with_retry(self._callable, path) for path in pending]
+
+        for index, text in zip(missing, texts):
+            results[index] = text
+            self._cache_put(digests[index], text)
+        return results  # type: ignore[return-value]
+
+    def _invoke_with_retry(self, backend: Callable[[_T], _R], argument: _T) -> _R:
+        for attempt in range(self.max_attempts - 1):
+            try:
+                return backend(argument)
+            except Exception as exc:
+                if not _is_transient_error(exc):
+                    raise
+                time.sleep(min(self.retry_max_delay, self.retry_base_delay * 2**attempt))
+        # Final attempt: any error now propagates to the caller.
+        return backend(argument)
+
+    # ------------------------------------------------------------------ Caching
+    def _cache_get(self, digest: bytes) -> Optional[str]:
+        with self._cache_lock:
+            text = self._cache.get(digest)
+            if text is not None:
+                self._cache.move_to_end(digest)
+                return text
+
+        if self.cache_dir is None:
+            return None
+        path = pathlib.Path(self.cache_dir) / f"{digest.hex()}.txt"
+        try:
+            text = path.read_text(encoding="utf-8")
+            # Refresh the modification time used for least-recently-used eviction.
+            os.utime(path)
+        except (OSError, ValueError):
+            # Missing, unreadable or corrupt (e.g. non-UTF-8) entries are misses;
+            # the entry is rewritten once the backend has recognised the image.
+            return None
+        self._remember(digest, text)
+        return text
+
+    def _cache_put(self, digest: bytes, text: str) -> None:
+        self._remember(digest, text)
+        if self.cache_dir is None:
+            return
+        # A cache that cannot be written (e.g. a read-only home directory)
+        # must never turn a successful OCR run into a failure.
+        try:
+            directory = pathlib.Path(self.cache_dir)
+            directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            target = directory / f"{digest.hex()}.txt"
+            partial = target.with_suffix(".tmp")
+            fd = os.open(partial, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with open(fd, "w", encoding="utf-8") as stream:
+                stream.write(text)
+            partial.replace(target)
+            self._trim_disk_cache(directory)
+        except OSError:
+            pass
+
+    def _trim_disk_cache(self, directory: pathlib.Path) -> None:
+        entries = list(directory.glob("*.txt"))
+        excess = len(entries) - max(self.disk_cache_size, 0)
+        if excess <= 0:
+            return
+        entries.sort(key=lambda path: path.stat().st_mtime)
+        for path in entries[:excess]:
+            path.unlink(missing_ok=True)
 
-        return self._callable(image_path)
+    def _remember(self, digest: bytes, text: str) -> None:
+        if self.cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._cache[digest] = text
+            self._cache.move_to_end(digest)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
 
 
 __all__ = ["OCRClient", "OCRClientError"]
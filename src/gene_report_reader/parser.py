@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import io
 import re
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Sequence, Tuple
+from functools import lru_cache
+from typing import Dict, Iterator, List, Set, TextIO, Tuple
 
 KeyValuePairs = List[Tuple[str, str]]
 
@@ -33,6 +35,10 @@ _CANONICAL_FIELD_NAMES = {
     "notes": "Notes",
 }
 
+# Lookup table keyed by case-folded field names.  Keys are normalised with a
+# single ``strip().casefold()`` before probing it.
+_CANON = {key.casefold(): value for key, value in _CANONICAL_FIELD_NAMES.items()}
+
 _VARIANT_KEYWORDS = (
     "pathogenic",
     "likely pathogenic",
@@ -42,13 +48,59 @@ _VARIANT_KEYWORDS = (
     "likely benign",
 )
 
-_VARIANT_LINE_RE = re.compile(
-    r"^(?P<gene>[A-Z0-9]+)[\s,:;-]+(?P<variant>c\.[^\s]+|p\.[^\s]+|exon[^\s]+|g\.[^\s]+).*?"
-    r"(?P<classification>pathogenic|likely pathogenic|variant of uncertain significance|vus|benign|likely benign)" ,
-    re.IGNORECASE,
+# Keywords that contain another keyword (e.g. "likely pathogenic") can never
+# decide a substring test on their own, so only the minimal set is scanned.
+_NOTE_KEYWORDS = tuple(
+    keyword
+    for keyword in _VARIANT_KEYWORDS
+    if not any(other != keyword and other in keyword for other in _VARIANT_KEYWORDS)
+)
+
+# Built once from ``_VARIANT_KEYWORDS``; longest first so that e.g.
+# "likely pathogenic" is preferred over "pathogenic" at the same position.
+_VARIANT_KEYWORD_ALTERNATION = "|".join(
+    re.escape(keyword) for keyword in sorted(_VARIANT_KEYWORDS, key=len, reverse=True)
+)
+
+# Every line boundary recognised by ``str.splitlines`` other than ``\n``.  They
+# are all replaced with ``\n`` before scanning so that the patterns below only
+# have to treat ``\n`` as a line end (``\r\n`` simply becomes an extra blank
+# line).  A regex substitution is used rather than ``str.translate``, which is
+# only fast for pure-ASCII text.
+_LINE_BREAK_RE = re.compile("[\r\x0b\x0c\x1c-\x1e\x85\u2028\u2029]")
+
+# ``[^\S\n]`` (whitespace other than a newline) is used instead of ``\s`` so
+# that none of the sub-patterns can run across a line boundary when the whole
+# OCR text is scanned at once.
+#
+# The key ends at the first separator, so a hyphen can only be its first
+# character (a separator cannot start the line).  Excluding it elsewhere lets
+# the key be matched greedily, instead of retrying the separator after every
+# character; trailing spaces it picks up are stripped by ``_normalise_key``.
+_KEY_VALUE_PATTERN = (
+    r"(?P<key>[\w/()\-][\w /()]*)"
+    r"[^\S\n]*[:|-][^\S\n]*(?P<value>.*\S)[^\S\n]*$"
+)
+
+_VARIANT_LINE_PATTERN = (
+    r"(?P<gene>[A-Z0-9]+)(?:[^\S\n]|[,:;-])+"
+    r"(?P<variant>c\.\S+|p\.\S+|exon\S+|g\.\S+).*?"
+    rf"(?P<classification>{_VARIANT_KEYWORD_ALTERNATION})"
 )
 
-_KEY_VALUE_RE = re.compile(r"^(?P<key>[\w /()\-]+?)\s*[:|-]\s*(?P<value>.+)$")
+# The alternatives are tried in order at every line start, mirroring the
+# precedence of the parser: key/value pairs, then variant annotations.  Any
+# other non-blank line is captured by ``line`` so that it can be checked for
+# classification keywords.  Matches are dispatched on ``groups()``, which
+# yields (key, value, gene, variant, classification, line).
+_LINE_RE = re.compile(
+    rf"(?m)^[^\S\n]*(?:{_KEY_VALUE_PATTERN}"
+    rf"|(?i:{_VARIANT_LINE_PATTERN})"
+    r"|(?P<line>.*\S))"
+)
+
+# Matches the stripped contents of a non-blank line.
+_STRIPPED_LINE_RE = re.compile(r"\S(?:.*\S)?")
 
 
 @dataclass
@@ -60,57 +112,81 @@ class ParsedReport:
     def to_markdown(self) -> str:
         return format_markdown_table(self.key_values)
 
+    def write_markdown(self, stream: TextIO) -> None:
+        """Write the Markdown table to ``stream`` row by row."""
+
+        _write_markdown_table(stream, self.key_values)
 
+
+@lru_cache(maxsize=512)
 def _normalise_key(raw_key: str) -> str:
-    canonical = _CANONICAL_FIELD_NAMES.get(raw_key.lower().strip())
-    if canonical:
-        return canonical
-    return raw_key.strip().title()
+    # Report fields come from a small vocabulary, so repeated keys are served
+    # from the cache instead of re-allocating the stripped/folded strings.
+    key = raw_key.strip()
+    return _CANON.get(key.casefold()) or key.title()
 
 
-def _merge_key_value_pairs(pairs: Iterable[Tuple[str, str]]) -> KeyValuePairs:
-    merged: Dict[str, str] = {}
-    for key, value in pairs:
-        key = _normalise_key(key)
-        value = value.strip()
-        if not value:
-            continue
-        if key in merged:
-            # Combine repeated values in a readable fashion.
-            existing = merged[key]
-            if value.lower() not in existing.lower():
-                merged[key] = f"{existing}; {value}"
+# OCR output often contains non-breaking spaces and tabs inside values; they
+# are turned into plain spaces in one pass.
+_WHITESPACE_TABLE = str.maketrans({"\u00a0": " ", "\t": " "})
+
+
+def _clean_value(value: str) -> str:
+    # ``str.translate`` is far slower than the substring checks, so it only runs
+    # on the rare values that need it (``isascii`` is a constant-time flag).
+    if "\t" in value or (not value.isascii() and "\u00a0" in value):
+        value = value.translate(_WHITESPACE_TABLE)
+    return value.strip()
+
+
+# Each key maps to its distinct values, in order, and their case-folded forms,
+# so repeated values are detected without rescanning.  The values are joined
+# once in ``parse_report_text`` rather than re-copied on every append.
+_MergedValues = Dict[str, Tuple[List[str], Set[str]]]
+
+
+def _merge_pair(merged: _MergedValues, key: str, value: str) -> None:
+    """Merge ``value`` into ``merged`` under the already normalised ``key``."""
+
+    value = _clean_value(value)
+    if not value:
+        return
+    folded = value.casefold()
+    if key in merged:
+        values, seen = merged[key]
+        if folded not in seen:
+            seen.add(folded)
+            values.append(value)
+    else:
+        merged[key] = ([value], {folded})
+
+
+def _iter_lines(text: str) -> Iterator[str]:
+    """Lazily yield the stripped, non-blank lines of ``text``."""
+
+    return (match.group(0) for match in _STRIPPED_LINE_RE.finditer(text))
+
+
+def _extract_into(text: str, merged: _MergedValues) -> None:
+    """Scan ``text`` and merge every pair found straight into ``merged``."""
+
+    for match in _LINE_RE.finditer(text):
+        key, value, gene, variant, classification, line = match.groups()
+        if key is not None:
+            _merge_pair(merged, _normalise_key(key), value)
+        elif gene is not None:
+            # The field names below are canonical already, so they skip
+            # ``_normalise_key`` entirely.
+            _merge_pair(merged, "Gene", gene)
+            _merge_pair(merged, "Variant", variant)
+            _merge_pair(merged, "Classification", classification.title())
         else:
-            merged[key] = value
-    return [(key, merged[key]) for key in merged]
-
-
-def _extract_key_values_from_lines(lines: Sequence[str]) -> KeyValuePairs:
-    pairs: KeyValuePairs = []
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-        match = _KEY_VALUE_RE.match(line)
-        if match:
-            pairs.append((match.group("key"), match.group("value")))
-            continue
-
-        variant_match = _VARIANT_LINE_RE.match(line)
-        if variant_match:
-            gene = variant_match.group("gene")
-            variant = variant_match.group("variant")
-            classification = variant_match.group("classification")
-            pairs.append(("Gene", gene))
-            pairs.append(("Variant", variant))
-            pairs.append(("Classification", classification.title()))
-            continue
-
-        # Look for inline mentions of important keywords (e.g. "Pathogenic"),
-        # and treat the whole sentence as a note if we cannot classify it better.
-        if any(keyword in line.lower() for keyword in _VARIANT_KEYWORDS):
-            pairs.append(("Notes", line))
-    return pairs
+            # Look for inline mentions of important keywords (e.g. "Pathogenic"),
+            # and treat the whole sentence as a note if we cannot classify it
+            # better.
+            lowered = line.lower()
+            if any(keyword in lowered for keyword in _NOTE_KEYWORDS):
+                _merge_pair(merged, "Notes", line)
 
 
 def parse_report_text(text: str) -> ParsedReport:
@@ -123,28 +199,44 @@ def parse_report_text(text: str) -> ParsedReport:
     the OCR introduces noise.
     """
 
-    lines = text.splitlines()
-    pairs = _extract_key_values_from_lines(lines)
+    text = _LINE_BREAK_RE.sub("\n", text)
+    merged: _MergedValues = {}
+    _extract_into(text, merged)
 
     # If we did not find any structured data, provide at least a Notes field so
     # the user can review the raw text from the GUI.
-    if not pairs:
-        cleaned = " ".join(line.strip() for line in lines if line.strip())
+    if not merged:
+        cleaned = " ".join(_iter_lines(text))
         if cleaned:
-            pairs.append(("Notes", cleaned))
+            _merge_pair(merged, "Notes", cleaned)
 
-    return ParsedReport(key_values=_merge_key_value_pairs(pairs))
+    # Combine repeated values in a readable fashion.
+    return ParsedReport(
+        key_values=[(key, "; ".join(values)) for key, (values, _) in merged.items()]
+    )
 
 
 def format_markdown_table(pairs: KeyValuePairs) -> str:
     """Return ``pairs`` formatted as a Markdown table."""
 
-    if not pairs:
-        return "| Field | Value |\n| --- | --- |\n| _(no data)_ | |"
+    buffer = io.StringIO()
+    _write_markdown_table(buffer, pairs)
+    return buffer.getvalue()
 
-    header = "| Field | Value |\n| --- | --- |"
-    rows = [f"| {key} | {value} |" for key, value in pairs]
-    return "\n".join([header, *rows])
+
+def _write_markdown_table(stream: TextIO, pairs: KeyValuePairs) -> None:
+    # Rows are written straight to ``stream`` rather than collected in an
+    # intermediate list of row strings.
+    stream.write("| Field | Value |\n| --- | --- |")
+    if not pairs:
+        stream.write("\n| _(no data)_ | |")
+        return
+    for key, value in pairs:
+        stream.write("\n| ")
+        stream.write(key)
+        stream.write(" | ")
+        stream.write(value)
+        stream.write(" |")
 
 
 __all__ = [
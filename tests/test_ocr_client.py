@@ -0,0 +1,209 @@
+import os
+import sys
+import types
+
+import pytest
+
+from gene_report_reader.ocr_client import OCRClient
+
+
+class _CountingBackend:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, image_path):
+        self.calls.append(image_path)
+        return f"text for {len(self.calls)}"
+
+
+def test_extract_text_caches_by_image_contents(tmp_path):
+    first = tmp_path / "first.png"
+    copy = tmp_path / "copy.png"
+    first.write_bytes(b"image-bytes")
+    copy.write_bytes(b"image-bytes")
+    backend = _CountingBackend()
+    client = OCRClient(backend, cache_dir=None)
+
+    assert client.extract_text(str(first)) == "text for 1"
+    assert client.extract_text(str(copy)) == "text for 1"
+    assert backend.calls == [str(first)]
+
+
+def test_extract_text_persists_cache_to_disk(tmp_path):
+    image = tmp_path / "report.png"
+    image.write_bytes(b"image-bytes")
+    cache_dir = tmp_path / "cache"
+
+    OCRClient(_CountingBackend(), cache_dir=cache_dir).extract_text(str(image))
+    backend = _CountingBackend()
+    text = OCRClient(backend, cache_dir=cache_dir).extract_text(str(image))
+
+    assert text == "text for 1"
+    assert backend.calls == []
+    assert len(list(cache_dir.glob("*.txt"))) == 1
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+def test_extract_text_keeps_disk_cache_private(tmp_path):
+    image = tmp_path / "report.png"
+    image.write_bytes(b"image-bytes")
+    cache_dir = tmp_path / "cache"
+
+    OCRClient(_CountingBackend(), cache_dir=cache_dir).extract_text(str(image))
+
+    assert cache_dir.stat().st_mode & 0o777 == 0o700
+    (entry,) = cache_dir.glob("*.txt")
+    assert entry.stat().st_mode & 0o777 == 0o600
+
+
+def test_extract_text_treats_corrupt_disk_cache_entries_as_misses(tmp_path):
+    image = tmp_path / "report.png"
+    image.write_bytes(b"image-bytes")
+    cache_dir = tmp_path / "cache"
+    OCRClient(_CountingBackend(), cache_dir=cache_dir).extract_text(str(image))
+    (entry,) = cache_dir.glob("*.txt")
+    entry.write_bytes(b"\xff\xfe not utf-8")
+
+    backend = _CountingBackend()
+    client = OCRClient(backend, cache_dir=cache_dir)
+
+    assert client.extract_text(str(image)) == "text for 1"
+    assert backend.calls == [str(image)]
+    assert entry.read_text(encoding="utf-8") == "text for 1"
+
+
+def test_extract_text_bounds_disk_cache(tmp_path):
+    cache_dir = tmp_path / "cache"
+    client = OCRClient(_CountingBackend(), cache_dir=cache_dir, disk_cache_size=2)
+    for index in range(3):
+        path = tmp_path / f"{index}.png"
+        path.write_bytes(bytes([index]))
+        client.extract_text(str(path))
+        # Make the write order visible regardless of the mtime resolution.
+        for entry in cache_dir.glob("*.txt"):
+            stat = entry.stat()
+            os.utime(entry, (stat.st_atime, stat.st_mtime - 10))
+
+    assert len(list(cache_dir.glob("*.txt"))) == 2
+    backend = _CountingBackend()
+    OCRClient(backend, cache_dir=cache_dir).extract_text(str(tmp_path / "0.png"))
+    assert backend.calls == [str(tmp_path / "0.png")]
+
+
+def test_extract_text_evicts_least_recently_used(tmp_path):
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"{index}.png"
+        path.write_bytes(bytes([index]))
+        paths.append(str(path))
+    backend = _CountingBackend()
+    client = OCRClient(backend, cache_size=2, cache_dir=None)
+
+    for path in paths:
+        client.extract_text(path)
+    client.extract_text(paths[0])
+
+    assert backend.calls == [*paths, paths[0]]
+
+
+def test_extract_text_batch_sends_uncached_images_in_one_call(tmp_path):
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"{index}.png"
+        path.write_bytes(bytes([index]))
+        paths.append(str(path))
+    batches = []
+
+    def batch_backend(image_paths):
+        batches.append(list(image_paths))
+        return [f"batch {path}" for path in image_paths]
+
+    client = OCRClient(_CountingBackend(), batch_backend, cache_dir=None)
+    client.extract_text(paths[1])
+
+    texts = client.extract_text_batch(paths)
+
+    assert texts == [f"batch {paths[0]}", "text for 1", f"batch {paths[2]}"]
+    assert batches == [[paths[0], paths[2]]]
+
+
+def test_extract_text_batch_falls_back_to_single_images(tmp_path):
+    paths = []
+    for index in range(2):
+        path = tmp_path / f"{index}.png"
+        path.write_bytes(bytes([index]))
+        paths.append(str(path))
+    backend = _CountingBackend()
+    client = OCRClient(backend, cache_dir=None)
+
+    assert client.extract_text_batch(paths) == ["text for 1", "text for 2"]
+    assert backend.calls == paths
+
+
+def test_extract_text_retries_transient_errors(tmp_path):
+    image = tmp_path / "report.png"
+    image.write_bytes(b"image-bytes")
+    failures = [RuntimeError("CUDA out of memory"), ValueError("HTTP 429: rate limit")]
+
+    def flaky_backend(image_path):
+        if failures:
+            raise failures.pop(0)
+        return "recognised"
+
+    client = OCRClient(flaky_backend, cache_dir=None, retry_base_delay=0)
+
+    assert client.extract_text(str(image)) == "recognised"
+    assert failures == []
+
+
+@pytest.mark.parametrize(
+    "error",
+    [
+        ValueError("unsupported image format"),
+        NotImplementedError("backend cannot read PDFs"),
+        RecursionError("maximum recursion depth exceeded"),
+        FileNotFoundError("tesseract"),
+        PermissionError("tesseract"),
+        IsADirectoryError("report.png"),
+    ],
+)
+def test_extract_text_does_not_retry_permanent_errors(tmp_path, error):
+    image = tmp_path / "report.png"
+    image.write_bytes(b"image-bytes")
+    calls = []
+
+    def broken_backend(image_path):
+        calls.append(image_path)
+        raise error
+
+    client = OCRClient(broken_backend, cache_dir=None, retry_base_delay=0)
+
+    with pytest.raises(type(error)):
+        client.extract_text(str(image))
+    assert len(calls) == 1
+
+
+def test_backend_discovery_is_shared_between_clients(monkeypatch):
+    instances = []
+
+    class FakeOCR:
+        def __init__(self):
+            instances.append(self)
+
+        def ocr(self, image_path):
+            return image_path
+
+        def ocr_batch(self, image_paths):
+            return list(image_paths)
+
+    module = types.ModuleType("olmOCR2")
+    module.OCR = FakeOCR
+    monkeypatch.setitem(sys.modules, "olmOCR2", module)
+    monkeypatch.setattr(OCRClient, "_resolved_backend", None)
+
+    first = OCRClient(cache_dir=None)
+    second = OCRClient(cache_dir=None)
+
+    assert len(instances) == 1
+    assert first._callable == second._callable == instances[0].ocr
+    assert second._batch_callable == instances[0].ocr_batch
@@ -1,6 +1,11 @@
+import io
 import textwrap
 
-from gene_report_reader.parser import format_markdown_table, parse_report_text
+from gene_report_reader.parser import (
+    ParsedReport,
+    format_markdown_table,
+    parse_report_text,
+)
 
 
 def test_parse_report_text_extracts_key_values():
@@ -29,6 +34,60 @@ def test_parse_report_text_extracts_key_values():
     assert dict(report.key_values) == expected
 
 
+def test_parse_report_text_handles_indentation_and_notes():
+    text = "  Gene: TP53\r\n\r\n   The finding is likely benign.  \r\nUnrelated line\r\n"
+
+    report = parse_report_text(text)
+
+    assert report.key_values == [
+        ("Gene", "TP53"),
+        ("Notes", "The finding is likely benign."),
+    ]
+
+
+def test_parse_report_text_splits_on_all_line_boundaries():
+    for separator in ("\r", "\x0c", "\u2028"):
+        text = separator.join(["Patient Name: Jane", "Gene: BRCA1", "Variant: c.1A>G"])
+
+        report = parse_report_text(text)
+
+        assert report.key_values == [
+            ("Patient Name", "Jane"),
+            ("Gene", "BRCA1"),
+            ("Variant", "c.1A>G"),
+        ]
+
+
+def test_parse_report_text_accepts_non_ascii_keys():
+    report = parse_report_text("Gène: BRCA1\nGröße: 12")
+
+    assert report.key_values == [("Gène", "BRCA1"), ("Größe", "12")]
+
+
+def test_parse_report_text_combines_repeated_fields():
+    text = "Gene: BRCA1\nGene: brca1\nGene: TP53\nGene: BRCA1"
+
+    report = parse_report_text(text)
+
+    assert report.key_values == [("Gene", "BRCA1; TP53")]
+
+
+def test_parse_report_text_keeps_values_contained_in_earlier_ones():
+    text = "Variant: c.68del BRCA1\nVariant: c.68del"
+
+    report = parse_report_text(text)
+
+    assert report.key_values == [("Variant", "c.68del BRCA1; c.68del")]
+
+
+def test_parse_report_text_normalises_whitespace_in_values():
+    text = "Patient Name:\tJane\u00a0Doe\nPatient Name: Jane Doe"
+
+    report = parse_report_text(text)
+
+    assert report.key_values == [("Patient Name", "Jane Doe")]
+
+
 def test_format_markdown_table_generates_table():
     markdown = format_markdown_table(
         [
@@ -43,3 +102,13 @@ def test_format_markdown_table_generates_table():
         "| Patient Name | Jane Doe |",
         "| Gene | BRCA1 |",
     ]
+
+
+def test_write_markdown_streams_same_table_as_to_markdown():
+    for pairs in ([("Gene", "BRCA1"), ("Variant", "c.68_69delAG")], []):
+        report = ParsedReport(key_values=pairs)
+        stream = io.StringIO()
+
+        report.write_markdown(stream)
+
+        assert stream.getvalue() == report.to_markdown()